@@ -9,8 +9,9 @@ import os
 import sys
 import pytest
 
-# Add the root directory to the Python path so we can import from src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), '..')))
+if __name__ == "__main__":
+    # Run directly, outside pytest's pythonpath: put the project root on sys.path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
 
 from src.mcp_core.engine.provider_loader import load_provider_config, get_available_providers
 
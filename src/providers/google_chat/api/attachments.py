@@ -3,12 +3,14 @@ from pathlib import Path
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 import mimetypes
+from typing import Callable
 
 from src.providers.google_chat.api.auth import get_credentials
 from src.providers.google_chat.api.messages import create_message
 
 
-async def upload_attachment(space_name: str, file_path: str, message_text: str = None, thread_key: str = None) -> dict:
+async def upload_attachment(space_name: str, file_path: str, message_text: str = None, thread_key: str = None,
+                            exists_fn: Callable[[str], bool] = os.path.exists) -> dict:
     """Upload a file attachment to a Google Chat space.
 
     Args:
@@ -17,6 +19,7 @@ async def upload_attachment(space_name: str, file_path: str, message_text: str =
         message_text: Optional text message to accompany the attachment
         thread_key: Optional thread key to reply to. If provided, the attachment
                    will be sent as a reply to the specified thread.
+        exists_fn: Callable used to check whether the file exists.
 
     Returns:
         The created message object
@@ -36,7 +39,7 @@ async def upload_attachment(space_name: str, file_path: str, message_text: str =
 
         # Validate file exists
         file_path = Path(file_path)
-        if not file_path.exists():
+        if not exists_fn(str(file_path)):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Get mimetype
@@ -92,7 +95,8 @@ async def upload_attachment(space_name: str, file_path: str, message_text: str =
         raise Exception(f"Failed to upload attachment: {str(e)}")
 
 
-async def send_file_message(space_name: str, file_path: str, message_text: str = None, thread_key: str = None) -> dict:
+async def send_file_message(space_name: str, file_path: str, message_text: str = None, thread_key: str = None,
+                            exists_fn: Callable[[str], bool] = os.path.exists) -> dict:
     """Send a message with file contents (simplified attachment alternative).
 
     This is a simplified alternative to file attachments that reads the file
@@ -105,6 +109,7 @@ async def send_file_message(space_name: str, file_path: str, message_text: str =
         message_text: Optional text message to accompany the file contents
         thread_key: Optional thread key to reply to. If provided, the file content
                    will be sent as a reply to the specified thread.
+        exists_fn: Callable used to check whether the file exists.
 
     Returns:
         The created message object
@@ -119,7 +124,7 @@ async def send_file_message(space_name: str, file_path: str, message_text: str =
 
         # Validate file exists
         file_path = Path(file_path)
-        if not file_path.exists():
+        if not exists_fn(str(file_path)):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Read file contents (limit to first 5000 characters)
@@ -3,7 +3,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -55,6 +55,34 @@ def get_token_info() -> Dict[str, Any]:
 # For backward compatibility
 token_info = get_token_info()
 
+# Parsed token files keyed by path, stored with the mtime they were read at
+_creds_cache: Dict[str, tuple] = {}
+
+
+def _load_credentials_file(token_path: str) -> Credentials:
+    """Load credentials from a token file, reusing the parsed result until its mtime changes.
+
+    Args:
+        token_path: Path to the token file
+
+    Returns:
+        Credentials parsed from the file
+    """
+    token_path = str(token_path)
+    try:
+        mtime = os.path.getmtime(token_path)
+    except OSError:
+        mtime = None
+
+    cached = _creds_cache.get(token_path)
+    if mtime is not None and cached and cached[0] == mtime:
+        return cached[1]
+
+    creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+    if mtime is not None:
+        _creds_cache[token_path] = (mtime, creds)
+    return creds
+
 
 def set_token_path(path: str) -> None:
     """Set the global token path for OAuth storage.
@@ -87,6 +115,7 @@ def save_credentials(creds: Credentials, token_path: Optional[str] = None) -> No
     logger.info(f"Saving credentials to file: {token_path}")
     with open(token_path, 'w') as token:
         token.write(creds.to_json())
+    _creds_cache.pop(str(token_path), None)
 
     # Update in-memory cache
     token_info['credentials'] = creds
@@ -94,11 +123,13 @@ def save_credentials(creds: Credentials, token_path: Optional[str] = None) -> No
     logger.info(f"Updated in-memory credentials cache")
 
 
-def get_credentials(token_path: Optional[str] = None) -> Optional[Credentials]:
+def get_credentials(token_path: Optional[str] = None,
+                    exists_fn: Callable[[str], bool] = os.path.exists) -> Optional[Credentials]:
     """Gets valid user credentials from storage or memory.
 
     Args:
         token_path: Optional path to token file. If None, uses the configured path.
+        exists_fn: Callable used to check whether the token file exists.
 
     Returns:
         Credentials object or None if no valid credentials exist
@@ -120,10 +151,11 @@ def get_credentials(token_path: Optional[str] = None) -> Optional[Credentials]:
     # If no credentials in memory, try to load from file
     if not creds:
         token_path = Path(token_path)
-        logger.info(f"Token path exists: {token_path.exists()}")
-        if token_path.exists():
+        token_exists = exists_fn(str(token_path))
+        logger.info(f"Token path exists: {token_exists}")
+        if token_exists:
             try:
-                creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+                creds = _load_credentials_file(token_path)
                 token_info['credentials'] = creds
                 logger.info(f"Loaded credentials from file: {creds is not None}")
                 logger.info(f"Credentials valid: {creds.valid if creds else None}")
@@ -149,11 +181,13 @@ def get_credentials(token_path: Optional[str] = None) -> Optional[Credentials]:
     return result
 
 
-async def refresh_token(token_path: Optional[str] = None) -> tuple[bool, str]:
+async def refresh_token(token_path: Optional[str] = None,
+                        exists_fn: Callable[[str], bool] = os.path.exists) -> tuple[bool, str]:
     """Attempt to refresh the current token.
 
     Args:
         token_path: Path to the token file. If None, uses the configured path.
+        exists_fn: Callable used to check whether the token file exists.
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -168,9 +202,9 @@ async def refresh_token(token_path: Optional[str] = None) -> tuple[bool, str]:
         creds = token_info['credentials']
         if not creds:
             token_path = Path(token_path)
-            if not token_path.exists():
+            if not exists_fn(str(token_path)):
                 return False, "No token file found"
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            creds = _load_credentials_file(token_path)
 
         if not creds.refresh_token:
             return False, "No refresh token available"
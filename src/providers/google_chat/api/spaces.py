@@ -33,6 +33,10 @@ async def manage_space_members(space_name: str, operation: str, user_emails: Lis
         Exception: If authentication fails or operation fails
     """
     try:
+        # Validate the request before paying for credentials and the API client
+        if operation.lower() not in ['add', 'remove']:
+            raise ValueError("Operation must be either 'add' or 'remove'")
+
         creds = get_credentials()
         if not creds:
             raise Exception("No valid credentials found. Please authenticate first.")
@@ -42,9 +46,6 @@ async def manage_space_members(space_name: str, operation: str, user_emails: Lis
         if not space_name.startswith('spaces/'):
             space_name = f"spaces/{space_name}"
 
-        if operation.lower() not in ['add', 'remove']:
-            raise ValueError("Operation must be either 'add' or 'remove'")
-
         results = {
             "operation": operation,
             "space": space_name,
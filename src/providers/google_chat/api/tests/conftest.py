@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the Google Chat API unit tests.
+"""
+
+import pytest
+
+
+class FakeCredentials:
+    """Plain stand-in for OAuth credentials in tests that only read their state flags."""
+    valid = True
+    expired = False
+    refresh_token = "dummy-refresh-token"
+
+
+@pytest.fixture(scope="session")
+def fake_creds():
+    """Credentials are only passed through or checked for validity, so one stub serves every test."""
+    return FakeCredentials()
+
+
+@pytest.fixture(scope="session")
+def build_stub():
+    """Factory for build() stand-ins that look the requested API up in a dict; unknown APIs raise KeyError."""
+    def make(**services):
+        return lambda name, *args, **kwargs: services[name]
+    return make
+
+
+@pytest.fixture
+def patch_api(monkeypatch, fake_creds, build_stub):
+    """Factory that points a module's get_credentials at fake_creds and its build() at the given services."""
+    def apply(module, **services):
+        monkeypatch.setattr(module, "get_credentials", lambda: fake_creds)
+        monkeypatch.setattr(module, "build", build_stub(**services))
+    return apply
@@ -0,0 +1,8 @@
+"""
+Payload builders shared by the search unit tests.
+"""
+
+
+def message_page(messages=()):
+    """Build a list_space_messages payload; search tags each message with space_info, so hand it copies."""
+    return {"messages": [dict(msg) for msg in messages]}
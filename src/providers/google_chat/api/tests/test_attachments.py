@@ -1,18 +1,30 @@
+import os
+import tempfile
 from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
 
-from src.providers.google_chat.api.attachments import upload_attachment, send_file_message
+from src.providers.google_chat.api import attachments
+from src.providers.google_chat.api.attachments import upload_attachment, send_file_message, send_file_content
+
+# Keep fixture files on tmpfs when available so they never hit the real disk
+TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+@pytest.fixture(scope="class")
+def class_creds():
+    """Patch attachments.get_credentials once for the whole class."""
+    with patch.object(attachments, "get_credentials", return_value=MagicMock()) as mock_get_creds:
+        yield mock_get_creds
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("class_creds")
 class TestAttachmentUtils:
 
-    @patch("src.providers.google_chat.api.attachments.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.attachments.Path.exists", return_value=True)
     @patch("src.providers.google_chat.api.attachments.MediaFileUpload")
     @patch("src.providers.google_chat.api.attachments.build")
-    async def test_upload_attachment_success(self, mock_build, mock_media, mock_exists, mock_get_creds):
+    async def test_upload_attachment_success(self, mock_build, mock_media):
         mock_service = MagicMock()
         mock_build.return_value = mock_service
 
@@ -22,38 +34,78 @@ class TestAttachmentUtils:
         # Simulate spaces().messages().create().execute()
         mock_service.spaces.return_value.messages.return_value.create.return_value.execute.return_value = {"message": "sent"}
 
-        result = await upload_attachment("spaces/test", "somefile.txt", "Here is a file")
+        result = await upload_attachment("spaces/test", "somefile.txt", "Here is a file", exists_fn=lambda _: True)
 
         assert "message" in result
-        mock_media.assert_called_once()
+        # Only the path is handed to the (mocked) uploader, so no real file is needed
+        mock_media.assert_called_once_with("somefile.txt", mimetype="text/plain", resumable=True)
 
-    @patch("src.providers.google_chat.api.attachments.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.attachments.Path.exists", return_value=False)
-    async def test_upload_attachment_file_not_found(self, mock_exists, mock_get_creds):
+    async def test_upload_attachment_file_not_found(self):
         with pytest.raises(Exception, match="File not found"):
-            await upload_attachment("spaces/test", "missing.txt")
+            await upload_attachment("spaces/test", "missing.txt", exists_fn=lambda _: False)
 
-    @patch("src.providers.google_chat.api.attachments.get_credentials", return_value=None)
-    async def test_upload_attachment_no_creds(self, mock_get_creds):
+    async def test_upload_attachment_no_creds(self, monkeypatch):
+        monkeypatch.setattr(attachments, "get_credentials", lambda: None)
         with pytest.raises(Exception, match="No valid credentials found"):
             await upload_attachment("spaces/test", "somefile.txt")
 
-    @patch("src.providers.google_chat.api.attachments.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.attachments.Path.exists", return_value=True)
     @patch("builtins.open", new_callable=mock_open, read_data="Sample content")
     @patch("src.providers.google_chat.api.attachments.create_message", return_value={"message": "mocked"})
-    async def test_send_file_message_success(self, mock_create, mock_open_, mock_exists, mock_get_creds):
-        result = await send_file_message("spaces/test", "sample.txt", "Here it is")
+    async def test_send_file_message_success(self, mock_create, mock_open_):
+        result = await send_file_message("spaces/test", "sample.txt", "Here it is", exists_fn=lambda _: True)
         assert "message" in result
         mock_create.assert_called_once()
 
-    @patch("src.providers.google_chat.api.attachments.get_credentials", return_value=None)
-    async def test_send_file_message_no_creds(self, mock_get_creds):
+    @patch("builtins.open", new_callable=mock_open)
+    @patch("src.providers.google_chat.api.attachments.create_message", return_value={"message": "mocked"})
+    async def test_send_file_message_binary_file(self, mock_create, mock_open_):
+        mock_open_.return_value.read.side_effect = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        await send_file_message("spaces/test", "image.png", exists_fn=lambda _: True)
+
+        assert "[Binary file content not shown]" in mock_create.call_args[0][1]
+
+    async def test_send_file_message_no_creds(self, monkeypatch):
+        monkeypatch.setattr(attachments, "get_credentials", lambda: None)
         with pytest.raises(Exception, match="No valid credentials found"):
             await send_file_message("spaces/test", "sample.txt")
 
-    @patch("src.providers.google_chat.api.attachments.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.attachments.Path.exists", return_value=False)
-    async def test_send_file_message_file_missing(self, mock_exists, mock_get_creds):
+    async def test_send_file_message_file_missing(self):
         with pytest.raises(Exception, match="File not found"):
-            await send_file_message("spaces/test", "sample.txt")
+            await send_file_message("spaces/test", "sample.txt", exists_fn=lambda _: False)
+
+
+@pytest.mark.serial
+@pytest.mark.xdist_group(name="filesystem")
+@pytest.mark.asyncio
+class TestSendFileContent:
+
+    @classmethod
+    def setup_class(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        cls.test_file_path = os.path.join(cls.tmpdir.name, "test_file.txt")
+
+    @classmethod
+    def teardown_class(cls):
+        cls.tmpdir.cleanup()
+
+    @patch("src.providers.google_chat.api.attachments.create_message", return_value={"message": "mocked"})
+    async def test_send_file_content_success(self, mock_create):
+        with open(self.test_file_path, "w") as f:
+            f.write("Sample content")
+
+        result = await send_file_content("test", self.test_file_path)
+
+        assert "message" in result
+        space_name, text = mock_create.call_args[0]
+        assert space_name == "spaces/test"
+        assert "Sample content" in text
+
+    @patch("src.providers.google_chat.api.attachments.create_message", return_value={"message": "mocked"})
+    async def test_send_file_content_creates_missing_file(self, mock_create):
+        missing_path = os.path.join(self.tmpdir.name, "sample_attachment.txt")
+
+        await send_file_content("spaces/test", missing_path)
+
+        assert os.path.exists(missing_path)
+        assert "sample_attachment.txt" in mock_create.call_args[0][1]
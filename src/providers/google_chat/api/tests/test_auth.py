@@ -1,8 +1,10 @@
+import os
 import pytest
 from unittest.mock import patch, MagicMock, mock_open, AsyncMock
-from google.oauth2.credentials import Credentials
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
+from src.providers.google_chat.api import auth
 from src.providers.google_chat.api.auth import (
     get_credentials,
     save_credentials,
@@ -11,6 +13,8 @@ from src.providers.google_chat.api.auth import (
     get_user_info_by_id
 )
 
+pytestmark = [pytest.mark.parallel, pytest.mark.xdist_group(name="token")]
+
 # Mock configuration for tests
 MOCK_CONFIG = {
     "token_path": "dummy/token.json",
@@ -25,60 +29,99 @@ MOCK_CONFIG = {
 
 DUMMY_TOKEN_PATH = "dummy/token.json"
 
+# Read-only People API profiles, built once for the module
+JANE_PROFILE = MappingProxyType({
+    "names": [{"displayName": "Jane Smith", "givenName": "Jane", "familyName": "Smith"}],
+    "emailAddresses": [{"value": "jane@example.com"}]
+})
+JOHN_PROFILE = MappingProxyType({
+    "names": [{"displayName": "John Doe", "givenName": "John", "familyName": "Doe"}],
+    "emailAddresses": [{"value": "john@example.com"}],
+    "photos": [{"url": "https://photo.example.com"}]
+})
+
+# Built once; save tests reset it instead of constructing a new mock_open each time
+MOCK_OPEN = mock_open()
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _token_snapshot():
+    """Snapshot the module-level token cache once per class and restore it afterwards."""
+    with patch.dict(auth.token_info):
+        yield
+
 
-@pytest.mark.asyncio
 class TestAuthUtils:
 
+    # Only read or serialised by the tests, so one plain namespace serves the whole class
+    DUMMY_CREDS = SimpleNamespace(valid=True, expired=False, refresh_token="dummy-refresh-token",
+                                  to_json=lambda: '{"token": "abc"}')
+
     @pytest.fixture(autouse=True)
     def mock_provider_config(self):
         """Mock the provider_loader.load_provider_config function to return our test config."""
         with patch("src.mcp_core.engine.provider_loader.load_provider_config", return_value=MOCK_CONFIG):
             yield
 
+    @pytest.fixture(autouse=True)
+    def _token_state(self, monkeypatch):
+        """Start each test with no credentials in memory and no parsed token files."""
+        monkeypatch.setitem(auth.token_info, "credentials", None)
+        monkeypatch.setitem(auth.token_info, "last_refresh", None)
+        monkeypatch.setattr(auth, "_creds_cache", {})
+
+    @pytest.fixture
+    def mock_from_file(self, monkeypatch):
+        mock = MagicMock()
+        monkeypatch.setattr(auth.Credentials, "from_authorized_user_file", mock)
+        return mock
+
+    @pytest.fixture
+    def mock_save(self, monkeypatch):
+        mock = MagicMock()
+        monkeypatch.setattr(auth, "save_credentials", mock)
+        return mock
+
     @pytest.fixture
-    def dummy_creds(self):
-        creds = MagicMock(spec=Credentials)
-        creds.valid = True
-        creds.expired = False
-        creds.refresh_token = "dummy-refresh-token"
-        creds.to_json.return_value = '{"token": "abc"}'
-        return creds
-
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_credentials_writes_to_file(self, mock_open_, dummy_creds):
-        save_credentials(dummy_creds, token_path=DUMMY_TOKEN_PATH)
-
-        mock_open_.assert_called_once_with(Path(DUMMY_TOKEN_PATH), "w")
-        handle = mock_open_.return_value
-        handle.write.assert_called_once_with(dummy_creds.to_json())
-
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("src.providers.google_chat.api.auth.Credentials.from_authorized_user_file")
-    def test_get_credentials_from_file(self, mock_from_file, mock_exists):
-        from src.providers.google_chat.api import auth
-        auth.token_info["credentials"] = None  # Clear in-memory cache
-
-        # Create mock credentials
-        mock_creds = MagicMock()
-        mock_creds.valid = True
-        mock_creds.expired = False
-        mock_creds.refresh_token = "dummy"
-        mock_from_file.return_value = mock_creds
-
-        result = get_credentials(DUMMY_TOKEN_PATH)
+    def people_get(self, patch_api):
+        """Point auth at a fresh People service mock and return its people().get().execute mock."""
+        service = MagicMock()
+        patch_api(auth, people=service)
+        return service.people.return_value.get.return_value.execute
+
+    def test_save_credentials_writes_to_file(self):
+        MOCK_OPEN.reset_mock()
+        with patch("builtins.open", MOCK_OPEN):
+            save_credentials(self.DUMMY_CREDS, token_path=DUMMY_TOKEN_PATH)
+
+        MOCK_OPEN.assert_called_once_with(Path(DUMMY_TOKEN_PATH), "w")
+        handle = MOCK_OPEN.return_value
+        handle.write.assert_called_once_with(self.DUMMY_CREDS.to_json())
+
+    def test_get_credentials_from_file(self, mock_from_file, fake_creds):
+        mock_from_file.return_value = fake_creds
+
+        result = get_credentials(DUMMY_TOKEN_PATH, exists_fn=lambda _: True)
 
         # Check identity
-        assert result is mock_creds
+        assert result is fake_creds
 
-    @patch("src.providers.google_chat.api.auth.save_credentials")
-    async def test_refresh_token_success(self, mock_save):
-        from src.providers.google_chat.api import auth
+    def test_load_credentials_file_reuses_until_mtime_changes(self, mock_from_file, tmp_path):
+        token_file = tmp_path / "token.json"
+        token_file.write_text("{}")
+
+        first = auth._load_credentials_file(token_file)
+        assert auth._load_credentials_file(token_file) is first
+        mock_from_file.assert_called_once()
 
-        dummy_creds = MagicMock(spec=Credentials)
-        dummy_creds.expired = True
-        dummy_creds.refresh_token = "refresh"
-        dummy_creds.valid = True
-        dummy_creds.refresh = MagicMock()
+        stat = token_file.stat()
+        os.utime(token_file, (stat.st_atime, stat.st_mtime + 10))
+        auth._load_credentials_file(token_file)
+        assert mock_from_file.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_success(self, mock_save):
+        dummy_creds = SimpleNamespace(expired=True, valid=True, refresh_token="refresh", refresh=MagicMock())
 
         auth.token_info["credentials"] = dummy_creds
 
@@ -88,52 +131,41 @@ class TestAuthUtils:
         dummy_creds.refresh.assert_called_once()
         mock_save.assert_called_once_with(dummy_creds, DUMMY_TOKEN_PATH)
 
-    @patch("pathlib.Path.exists", return_value=False)
-    async def test_refresh_token_no_creds(self, mock_exists):
-        from src.providers.google_chat.api import auth
-        auth.token_info["credentials"] = None
-
-        success, msg = await refresh_token(DUMMY_TOKEN_PATH)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("token_exists,refresh_token_value,refresh_side_effect,expected_message", [
+        (False, None, None, "no token file found"),
+        (True, None, None, "no refresh token available"),
+        (True, "refresh", Exception("network down"), "failed to refresh token: network down"),
+    ])
+    async def test_refresh_token_failures(self, mock_from_file, mock_save, token_exists,
+                                          refresh_token_value, refresh_side_effect, expected_message):
+        mock_from_file.return_value.refresh_token = refresh_token_value
+        mock_from_file.return_value.refresh.side_effect = refresh_side_effect
+
+        success, msg = await refresh_token(DUMMY_TOKEN_PATH, exists_fn=lambda _: token_exists)
         assert not success
-        assert "no token file" in msg.lower()
-
-    @patch("src.providers.google_chat.api.auth.get_credentials")
-    @patch("src.providers.google_chat.api.auth.build")
-    async def test_get_current_user_info_success(self, mock_build, mock_get_creds, dummy_creds):
-        mock_people = MagicMock()
-        mock_get = mock_people.people.return_value.get
-        mock_get.return_value.execute.return_value = {
-            "names": [{"displayName": "Jane Smith", "givenName": "Jane", "familyName": "Smith"}],
-            "emailAddresses": [{"value": "jane@example.com"}]
-        }
+        assert expected_message in msg.lower()
+        mock_save.assert_not_called()
 
-        mock_build.return_value = mock_people
-        mock_get_creds.return_value = dummy_creds
+    @pytest.mark.asyncio
+    async def test_get_current_user_info_success(self, people_get):
+        people_get.return_value = JANE_PROFILE
 
         result = await get_current_user_info()
         assert result["email"] == "jane@example.com"
         assert result["display_name"] == "Jane Smith"
 
-    @patch("src.providers.google_chat.api.auth.get_credentials")
-    @patch("src.providers.google_chat.api.auth.build")
-    async def test_get_user_info_by_id_success(self, mock_build, mock_get_creds, dummy_creds):
-        mock_people = MagicMock()
-        mock_get = mock_people.people.return_value.get
-        mock_get.return_value.execute.return_value = {
-            "names": [{"displayName": "John Doe", "givenName": "John", "familyName": "Doe"}],
-            "emailAddresses": [{"value": "john@example.com"}],
-            "photos": [{"url": "https://photo.example.com"}]
-        }
-
-        mock_build.return_value = mock_people
-        mock_get_creds.return_value = dummy_creds
+    @pytest.mark.asyncio
+    async def test_get_user_info_by_id_success(self, people_get):
+        people_get.return_value = JOHN_PROFILE
 
         result = await get_user_info_by_id("users/123")
         assert result["email"] == "john@example.com"
         assert result["display_name"] == "John Doe"
         assert result["profile_photo"].startswith("https://")
 
-    @patch("src.providers.google_chat.api.auth.get_credentials", return_value=None)
-    async def test_get_user_info_by_id_no_creds(self, mock_get_creds):
+    @pytest.mark.asyncio
+    async def test_get_user_info_by_id_no_creds(self, monkeypatch):
+        monkeypatch.setattr(auth, "get_credentials", lambda: None)
         with pytest.raises(Exception, match="No valid credentials found"):
             await get_user_info_by_id("users/123")
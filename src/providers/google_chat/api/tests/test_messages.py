@@ -2,9 +2,12 @@ from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 
+from src.providers.google_chat.api import messages
 from src.providers.google_chat.api.messages import list_space_messages, create_message, update_message, reply_to_thread, \
     get_message, delete_message, add_emoji_reaction, list_messages_with_sender_info, get_message_with_sender_info
 
+pytestmark = pytest.mark.parallel
+
 
 MOCK_MESSAGE = {
     "name": "spaces/abc/messages/123",
@@ -17,15 +20,18 @@ MOCK_MESSAGE = {
 }
 
 
+@pytest.fixture
+def mock_service(patch_api):
+    """Point build/get_credentials in the messages module at a fresh Chat service mock."""
+    service = MagicMock()
+    patch_api(messages, chat=service)
+    return service
+
 
 @pytest.mark.asyncio
 class TestListSpaceMessages:
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_basic(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    async def test_basic(self, mock_service):
         mock_service.spaces.return_value.messages.return_value.list.return_value.execute.return_value = {
             "messages": [MOCK_MESSAGE]
         }
@@ -33,12 +39,8 @@ class TestListSpaceMessages:
         result = await list_space_messages("spaces/abc")
         assert result["messages"][0]["text"] == "Test message"
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
     @patch("src.providers.google_chat.api.messages.create_date_filter")
-    async def test_with_date_filter(self, mock_date_filter, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    async def test_with_date_filter(self, mock_date_filter, mock_service):
         mock_service.spaces.return_value.messages.return_value.list.return_value.execute.return_value = {
             "messages": [MOCK_MESSAGE]
         }
@@ -49,12 +51,8 @@ class TestListSpaceMessages:
         assert "messages" in result
         mock_date_filter.assert_called_once()
 
-    @patch("src.providers.google_chat.api.messages.get_user_info_by_id", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_with_sender_info(self, mock_get_creds, mock_build, mock_user_info):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    @patch.object(messages, "get_user_info_by_id", new_callable=AsyncMock, spec=messages.get_user_info_by_id)
+    async def test_with_sender_info(self, mock_user_info, mock_service):
         mock_service.spaces.return_value.messages.return_value.list.return_value.execute.return_value = {
             "messages": [MOCK_MESSAGE]
         }
@@ -65,9 +63,7 @@ class TestListSpaceMessages:
         assert "sender_info" in result["messages"][0]
         assert result["messages"][0]["sender_info"]["email"] == "test@example.com"
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_invalid_date(self, mock_get_creds, mock_build):
+    async def test_invalid_date(self, mock_service):
         # Test negative days_window
         with pytest.raises(ValueError, match="days_window must be positive"):
             await list_space_messages("spaces/abc", days_window=-1)
@@ -83,12 +79,7 @@ CARDS = [{"card_id": "123", "content": "Test card"}]
 @pytest.mark.asyncio
 class TestCreateMessage:
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_create_message_basic(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
+    async def test_create_message_basic(self, mock_service):
         mock_response = {"name": "spaces/abc/messages/999", "text": TEXT}
         mock_service.spaces.return_value.messages.return_value.create.return_value.execute.return_value = mock_response
 
@@ -96,12 +87,7 @@ class TestCreateMessage:
         assert result["name"] == "spaces/abc/messages/999"
         assert result["text"] == TEXT
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_create_message_with_cards(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
+    async def test_create_message_with_cards(self, mock_service):
         mock_response = {"name": "spaces/abc/messages/1000", "text": TEXT, "cardsV2": CARDS}
         mock_service.spaces.return_value.messages.return_value.create.return_value.execute.return_value = mock_response
 
@@ -122,24 +108,14 @@ UPDATED_CARDS = [{"card_id": "card_001"}]
 @pytest.mark.asyncio
 class TestUpdateMessage:
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_update_text_only(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
+    async def test_update_text_only(self, mock_service):
         mock_response = {"name": MESSAGE_NAME, "text": UPDATED_TEXT}
         mock_service.spaces.return_value.messages.return_value.patch.return_value.execute.return_value = mock_response
 
         result = await update_message(MESSAGE_NAME, text=UPDATED_TEXT)
         assert result["text"] == UPDATED_TEXT
 
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_update_cards_only(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
+    async def test_update_cards_only(self, mock_service):
         mock_response = {"name": MESSAGE_NAME, "cardsV2": UPDATED_CARDS}
         mock_service.spaces.return_value.messages.return_value.patch.return_value.execute.return_value = mock_response
 
@@ -167,13 +143,7 @@ THREAD_KEY = "sample-thread-key"
 class TestReplyToThread:
 
     @pytest.mark.asyncio
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_reply_to_thread_direct_key(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        mock_get_creds.return_value = MagicMock()
-
+    async def test_reply_to_thread_direct_key(self, mock_service):
         # Setup fake API return
         mock_create = mock_service.spaces.return_value.messages.return_value.create
         mock_create.return_value.execute.return_value = {"name": MESSAGE_NAME}
@@ -186,13 +156,8 @@ class TestReplyToThread:
 
 
     @pytest.mark.asyncio
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_reply_to_thread_with_full_thread_name(self, mock_get_creds, mock_build):
+    async def test_reply_to_thread_with_full_thread_name(self, mock_service):
         thread_name = "spaces/abc/threads/xyz"
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        mock_get_creds.return_value = MagicMock()
 
         mock_create = mock_service.spaces.return_value.messages.return_value.create
         mock_create.return_value.execute.return_value = {"name": MESSAGE_NAME}
@@ -205,13 +170,7 @@ class TestReplyToThread:
 
 
     @pytest.mark.asyncio
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_reply_to_thread_fallback_to_thread_lookup(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        mock_get_creds.return_value = MagicMock()
-
+    async def test_reply_to_thread_fallback_to_thread_lookup(self, mock_service):
         thread_key = "fallback-thread-id"
         fake_thread_name = "spaces/abc/threads/xyz"
 
@@ -234,23 +193,15 @@ class TestReplyToThread:
 class TestGetMessage:
 
     @pytest.mark.asyncio
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_get_message_basic(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    async def test_get_message_basic(self, mock_service):
         mock_service.spaces.return_value.messages.return_value.get.return_value.execute.return_value = MOCK_MESSAGE
 
         result = await get_message("spaces/abc/messages/123")
         assert result["text"] == "Test message"
 
     @pytest.mark.asyncio
-    @patch("src.providers.google_chat.api.messages.get_user_info_by_id", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_get_message_with_sender_info(self, mock_get_creds, mock_build, mock_user_info):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    @patch.object(messages, "get_user_info_by_id", new_callable=AsyncMock, spec=messages.get_user_info_by_id)
+    async def test_get_message_with_sender_info(self, mock_user_info, mock_service):
         mock_service.spaces.return_value.messages.return_value.get.return_value.execute.return_value = MOCK_MESSAGE
         mock_user_info.return_value = {"display_name": "Sender Test"}
 
@@ -269,11 +220,7 @@ class TestGetMessage:
 class TestDeleteMessage:
 
     @pytest.mark.asyncio
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_delete_message_success(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    async def test_delete_message_success(self, mock_service):
         mock_service.spaces.return_value.messages.return_value.delete.return_value.execute.return_value = {}
 
         result = await delete_message("spaces/abc/messages/123")
@@ -288,11 +235,7 @@ class TestDeleteMessage:
 
 @pytest.mark.asyncio
 class TestAddEmojiReaction:
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_add_emoji_reaction_success(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    async def test_add_emoji_reaction_success(self, mock_service):
         mock_service.spaces.return_value.messages.return_value.reactions.return_value.create.return_value.execute.return_value = {}
 
         result = await add_emoji_reaction("spaces/abc/messages/123", emoji="👍")
@@ -312,44 +255,30 @@ MESSAGES_WITH_SENDER = [
 @pytest.mark.asyncio
 class TestGetMessageWithSenderInfo:
 
-    @patch("src.providers.google_chat.api.messages.get_user_info_by_id", new_callable=AsyncMock)
-    async def test_returns_enriched_message(self, mock_user_info):
+    @patch.object(messages, "get_user_info_by_id", new_callable=AsyncMock, spec=messages.get_user_info_by_id)
+    async def test_returns_enriched_message(self, mock_user_info, mock_service):
         mock_user_info.return_value = {
             "email": "test@example.com",
             "display_name": "Test User"
         }
 
-        # Also patch API service to avoid real call
-        with patch("src.providers.google_chat.api.messages.build") as mock_build, \
-                patch("src.providers.google_chat.api.messages.get_credentials") as mock_creds:
-            mock_service = MagicMock()
-            mock_build.return_value = mock_service
-            mock_creds.return_value = MagicMock()
-
-            mock_service.spaces.return_value.messages.return_value.get.return_value.execute.return_value = {
-                "name": "spaces/abc/messages/123",
-                "text": "Hello!",
-                "sender": {"name": "users/123"}
-            }
+        mock_service.spaces.return_value.messages.return_value.get.return_value.execute.return_value = {
+            "name": "spaces/abc/messages/123",
+            "text": "Hello!",
+            "sender": {"name": "users/123"}
+        }
 
-            result = await get_message_with_sender_info("spaces/abc/messages/123")
+        result = await get_message_with_sender_info("spaces/abc/messages/123")
 
-            assert result["sender_info"]["email"] == "test@example.com"
-            assert result["sender_info"]["display_name"] == "Test User"
+        assert result["sender_info"]["email"] == "test@example.com"
+        assert result["sender_info"]["display_name"] == "Test User"
 
 
 @pytest.mark.asyncio
 class TestListMessagesWithSenderInfo:
 
-    @patch("src.providers.google_chat.api.messages.get_user_info_by_id", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.messages.build")
-    @patch("src.providers.google_chat.api.messages.get_credentials")
-    async def test_enriches_messages_with_sender_info(self, mock_get_creds, mock_build, mock_user_info):
-        # Prepare fake service and credentials
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        mock_get_creds.return_value = MagicMock()
-
+    @patch.object(messages, "get_user_info_by_id", new_callable=AsyncMock, spec=messages.get_user_info_by_id)
+    async def test_enriches_messages_with_sender_info(self, mock_user_info, mock_service):
         # Simulate API returning messages with senders
         mock_service.spaces.return_value.messages.return_value.list.return_value.execute.return_value = {
             "messages": [
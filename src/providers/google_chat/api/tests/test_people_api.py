@@ -1,15 +1,10 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from src.providers.google_chat.api import people_api
 
 
-@pytest.mark.asyncio
 class TestPeopleAPI:
 
-    @pytest.fixture
-    def dummy_creds(self):
-        return MagicMock()
-
     @pytest.fixture
     def dummy_person(self):
         return {
@@ -20,56 +15,50 @@ class TestPeopleAPI:
         }
 
     @patch("src.providers.google_chat.api.people_api.get_people_service")
-    def test_get_user_profile_success(self, mock_service, dummy_creds, dummy_person):
+    def test_get_user_profile_success(self, mock_service, fake_creds, dummy_person):
         mock_get = mock_service.return_value.people.return_value.get
         mock_get.return_value.execute.return_value = dummy_person
 
-        result = people_api.get_user_profile("users/123", dummy_creds)
+        result = people_api.get_user_profile("users/123", fake_creds)
 
         assert result["display_name"] == "Alice Smith"
         assert result["email"] == "alice@example.com"
         assert result["profile_photo"] == "http://photo.url/pic.jpg"
 
     @patch("src.providers.google_chat.api.people_api.get_people_service")
-    def test_get_user_profile_failure(self, mock_service, dummy_creds):
+    def test_get_user_profile_failure(self, mock_service, fake_creds):
         mock_get = mock_service.return_value.people.return_value.get
         mock_get.return_value.execute.side_effect = Exception("fail")
 
-        result = people_api.get_user_profile("users/123", dummy_creds)
+        result = people_api.get_user_profile("users/123", fake_creds)
 
         assert result is None
 
     @patch("src.providers.google_chat.api.people_api.get_people_service")
-    def test_batch_get_user_profiles_success(self, mock_service, dummy_creds, dummy_person):
+    def test_batch_get_user_profiles_success(self, mock_service, fake_creds, dummy_person):
         mock_get_batch = mock_service.return_value.people.return_value.getBatchGet
         mock_get_batch.return_value.execute.return_value = {
             "responses": [{"person": dummy_person}]
         }
 
-        result = people_api.batch_get_user_profiles(["123"], dummy_creds)
+        result = people_api.batch_get_user_profiles(["123"], fake_creds)
 
         assert isinstance(result, list)
         assert result[0]["email"] == "alice@example.com"
 
+    @pytest.mark.parametrize("execute_behavior,user_ids,expected", [
+        # second entry lacks "person"
+        ({"return_value": {"responses": [{"person": {}}, {}]}}, ["1", "2"], [{}, None]),
+        ({"side_effect": Exception("API failed")}, ["123"], []),
+    ], ids=["partial", "error"])
     @patch("src.providers.google_chat.api.people_api.get_people_service")
-    def test_batch_get_user_profiles_partial(self, mock_service, dummy_creds):
-        mock_get_batch = mock_service.return_value.people.return_value.getBatchGet
-        mock_get_batch.return_value.execute.return_value = {
-            "responses": [{"person": {}}, {}]  # second entry lacks "person"
-        }
-
-        result = people_api.batch_get_user_profiles(["1", "2"], dummy_creds)
-
-        assert result == [{}, None]
-
-    @patch("src.providers.google_chat.api.people_api.get_people_service")
-    def test_batch_get_user_profiles_error(self, mock_service, dummy_creds):
+    def test_batch_get_user_profiles_degraded(self, mock_service, fake_creds, execute_behavior, user_ids, expected):
         mock_get_batch = mock_service.return_value.people.return_value.getBatchGet
-        mock_get_batch.return_value.execute.side_effect = Exception("API failed")
+        mock_get_batch.return_value.execute.configure_mock(**execute_behavior)
 
-        result = people_api.batch_get_user_profiles(["123"], dummy_creds)
+        result = people_api.batch_get_user_profiles(user_ids, fake_creds)
 
-        assert result == []
+        assert result == expected
 
     def test_get_user_email_and_display_name(self, dummy_person):
         parsed = people_api._parse_person_info(dummy_person)
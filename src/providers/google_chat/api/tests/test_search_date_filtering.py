@@ -1,7 +1,14 @@
+from contextlib import ExitStack
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+from src.providers.google_chat.api import search
 from src.providers.google_chat.api.search import search_messages
+from src.providers.google_chat.api.tests.payloads import message_page
+
+pytestmark = [pytest.mark.parallel, pytest.mark.xdist_group(name="async_search")]
 
 # Mock configuration for tests
 MOCK_CONFIG = {
@@ -10,16 +17,16 @@ MOCK_CONFIG = {
 
 # Shared constants
 SPACE = "spaces/test"
-MSG_OLD = {
+MSG_OLD = MappingProxyType({
     "name": f"{SPACE}/messages/123",
     "text": "Here's the quarterly financial report we discussed",
     "createTime": "2024-05-13T14:30:00Z"
-}
-MSG_RECENT = {
+})
+MSG_RECENT = MappingProxyType({
     "name": f"{SPACE}/messages/456",
     "text": "The latest financial analysis is now available",
     "createTime": "2024-05-20T09:15:00Z"
-}
+})
 
 
 @pytest.fixture(autouse=True)
@@ -28,123 +35,133 @@ def mock_provider_config():
     with patch("src.mcp_core.engine.provider_loader.load_provider_config", return_value=MOCK_CONFIG):
         yield
 
+
+@pytest.fixture(scope="module")
+def patched_search():
+    """Patch list_space_messages and SearchManager in the search module once for every test here."""
+    with ExitStack() as stack:
+        mock_list = stack.enter_context(
+            patch.object(search, "list_space_messages", new_callable=AsyncMock, spec=search.list_space_messages))
+        mock_mgr_cls = stack.enter_context(patch("src.providers.google_chat.api.search.SearchManager"))
+        yield mock_list, mock_mgr_cls
+
+
+@pytest.fixture
+def mock_list_messages(patched_search):
+    """The module's list_space_messages mock, with calls and configured results cleared."""
+    mock_list, _ = patched_search
+    mock_list.reset_mock(return_value=True, side_effect=True)
+    return mock_list
+
+
+@pytest.fixture
+def search_mgr(patched_search):
+    """The module's SearchManager instance mock, cleared and defaulting to semantic mode."""
+    _, mock_mgr_cls = patched_search
+    mock_mgr_cls.reset_mock()
+    mgr = mock_mgr_cls.return_value
+    mgr.reset_mock(return_value=True, side_effect=True)
+    mgr.get_default_mode.return_value = "semantic"
+    return mgr
+
+
 @pytest.mark.asyncio
-async def test_date_filter_formatting_and_fallback_with_semantic():
+async def test_date_filter_formatting_and_fallback_with_semantic(mock_list_messages, search_mgr):
     """
     Test that days_window and offset parameters work correctly and fallback is triggered
     if no results are returned with initial date filtering.
     """
-    with patch("src.providers.google_chat.api.search.list_space_messages", new_callable=AsyncMock) as mock_list_messages:
-        # First call with days_window=1 and offset=5 returns no messages
-        # Second call with expanded date range (days_window=2) returns a message
-        mock_list_messages.side_effect = [
-            {"messages": []},
-            {"messages": [MSG_OLD]},
-        ]
-
-        with patch("src.providers.google_chat.api.search.SearchManager") as mock_mgr:
-            search_mgr = MagicMock()
-            mock_mgr.return_value = search_mgr
-            search_mgr.search.return_value = [(0.9, MSG_OLD)]
-            search_mgr.get_default_mode.return_value = "semantic"
-
-            result = await search_messages(
-                query="financial report",
-                search_mode="semantic",
-                spaces=[SPACE],
-                days_window=1,
-                offset=5
-            )
-
-        # Verify the first call used the original parameters
-        first_call_args = mock_list_messages.call_args_list[0][1]
-        assert first_call_args["days_window"] == 1
-        assert first_call_args["offset"] == 5
-
-        # Verify the second call used an expanded date window
-        second_call_args = mock_list_messages.call_args_list[1][1]
-        assert second_call_args["days_window"] == 2  # Double the original
-        assert second_call_args["offset"] == 5  # Same offset
-
-        # Verify result has the message
-        assert len(result["messages"]) == 1
-        assert result["messages"][0]["name"] == MSG_OLD["name"]
-        assert mock_list_messages.call_count == 2
+    # First call with days_window=1 and offset=5 returns no messages
+    # Second call with expanded date range (days_window=2) returns a message
+    mock_list_messages.side_effect = [
+        message_page(),
+        message_page([MSG_OLD]),
+    ]
+
+    search_mgr.search.return_value = [(0.9, MSG_OLD)]
+
+    result = await search_messages(
+        query="financial report",
+        search_mode="semantic",
+        spaces=[SPACE],
+        days_window=1,
+        offset=5
+    )
+
+    # Verify the first call used the original parameters
+    first_call_args = mock_list_messages.call_args_list[0][1]
+    assert first_call_args["days_window"] == 1
+    assert first_call_args["offset"] == 5
+
+    # Verify the second call used an expanded date window
+    second_call_args = mock_list_messages.call_args_list[1][1]
+    assert second_call_args["days_window"] == 2  # Double the original
+    assert second_call_args["offset"] == 5  # Same offset
+
+    # Verify result has the message
+    assert len(result["messages"]) == 1
+    assert result["messages"][0]["name"] == MSG_OLD["name"]
+    assert mock_list_messages.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_returns_results_within_date_range_with_semantic():
+async def test_returns_results_within_date_range_with_semantic(mock_list_messages, search_mgr):
     """Test that messages within the date range are returned correctly."""
-    with patch("src.providers.google_chat.api.search.list_space_messages", new_callable=AsyncMock) as mock_list_messages:
-        mock_list_messages.return_value = {"messages": [MSG_RECENT]}
+    mock_list_messages.return_value = message_page([MSG_RECENT])
 
-        with patch("src.providers.google_chat.api.search.SearchManager") as mock_mgr:
-            search_mgr = MagicMock()
-            mock_mgr.return_value = search_mgr
-            search_mgr.search.return_value = [(0.92, MSG_RECENT)]
-            search_mgr.get_default_mode.return_value = "semantic"
+    search_mgr.search.return_value = [(0.92, MSG_RECENT)]
 
-            result = await search_messages(
-                query="financial analysis",
-                search_mode="semantic",
-                spaces=[SPACE],
-                days_window=7
-            )
+    result = await search_messages(
+        query="financial analysis",
+        search_mode="semantic",
+        spaces=[SPACE],
+        days_window=7
+    )
 
-        assert len(result["messages"]) == 1
-        assert result["messages"][0]["name"] == MSG_RECENT["name"]
-        assert mock_list_messages.call_count == 1
+    assert len(result["messages"]) == 1
+    assert result["messages"][0]["name"] == MSG_RECENT["name"]
+    assert mock_list_messages.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_falls_back_when_no_date_results_with_semantic():
+async def test_falls_back_when_no_date_results_with_semantic(mock_list_messages, search_mgr):
     """
     If no messages are found with the date filter, search should retry without it.
     """
-    with patch("src.providers.google_chat.api.search.list_space_messages", new_callable=AsyncMock) as mock_list_messages:
-        mock_list_messages.side_effect = [
-            {"messages": []},
-            {"messages": [MSG_OLD]}
-        ]
-
-        with patch("src.providers.google_chat.api.search.SearchManager") as mock_mgr:
-            search_mgr = MagicMock()
-            mock_mgr.return_value = search_mgr
-            search_mgr.search.return_value = [(0.95, MSG_OLD)]
-            search_mgr.get_default_mode.return_value = "semantic"
-
-            result = await search_messages(
-                query="financial report",
-                search_mode="semantic",
-                spaces=[SPACE],
-                days_window=7
-            )
-
-        assert len(result["messages"]) == 1
-        assert result["messages"][0]["name"] == MSG_OLD["name"]
-        assert mock_list_messages.call_count == 2
+    mock_list_messages.side_effect = [
+        message_page(),
+        message_page([MSG_OLD])
+    ]
+
+    search_mgr.search.return_value = [(0.95, MSG_OLD)]
+
+    result = await search_messages(
+        query="financial report",
+        search_mode="semantic",
+        spaces=[SPACE],
+        days_window=7
+    )
+
+    assert len(result["messages"]) == 1
+    assert result["messages"][0]["name"] == MSG_OLD["name"]
+    assert mock_list_messages.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_regex_enforces_strict_date_filtering():
+@pytest.mark.parametrize("search_mode", ["regex", "exact", "hybrid"])
+async def test_non_semantic_modes_enforce_strict_date_filtering(mock_list_messages, search_mgr, search_mode):
     """
-    Regex search should not fall back and must strictly enforce date filters.
+    Only semantic search falls back; every other mode must strictly enforce date filters.
     """
-    with patch("src.providers.google_chat.api.search.list_space_messages", new_callable=AsyncMock) as mock_list_messages:
-        mock_list_messages.return_value = {"messages": []}
-
-        with patch("src.providers.google_chat.api.search.SearchManager") as mock_mgr:
-            search_mgr = MagicMock()
-            mock_mgr.return_value = search_mgr
-            search_mgr.get_default_mode.return_value = "regex"
-
-            result = await search_messages(
-                query="budget",
-                search_mode="regex",
-                spaces=[SPACE],
-                days_window=7
-            )
-
-        assert len(result["messages"]) == 0
-        assert mock_list_messages.call_count == 1
-        search_mgr.search.assert_not_called()
+    mock_list_messages.return_value = message_page()
+
+    result = await search_messages(
+        query="budget",
+        search_mode=search_mode,
+        spaces=[SPACE],
+        days_window=7
+    )
+
+    assert len(result["messages"]) == 0
+    assert mock_list_messages.call_count == 1
+    search_mgr.search.assert_not_called()
@@ -1,19 +1,24 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
+from src.providers.google_chat.api import spaces
 from src.providers.google_chat.api.spaces import list_chat_spaces, manage_space_members
 
+pytestmark = pytest.mark.parallel
+
+
+@pytest.fixture
+def mock_service(patch_api):
+    """Swap build/get_credentials in the spaces module and return a fresh service mock."""
+    service = MagicMock()
+    patch_api(spaces, chat=service)
+    return service
+
 
 @pytest.mark.asyncio
 class TestChatSpaces:
 
-    @patch("src.providers.google_chat.api.spaces.build")
-    @patch("src.providers.google_chat.api.spaces.get_credentials")
-    async def test_list_chat_spaces_success(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        mock_get_creds.return_value = MagicMock()
-
+    async def test_list_chat_spaces_success(self, mock_service):
         mock_service.spaces.return_value.list.return_value.execute.return_value = {
             "spaces": [{"name": "spaces/abc", "displayName": "Test Space"}]
         }
@@ -27,26 +32,14 @@ class TestChatSpaces:
         with pytest.raises(Exception, match="No valid credentials found"):
             await list_chat_spaces()
 
-    @patch("src.providers.google_chat.api.spaces.build")
-    @patch("src.providers.google_chat.api.spaces.get_credentials")
-    async def test_manage_members_add_success(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_get_creds.return_value = MagicMock()
-        mock_build.return_value = mock_service
-
+    async def test_manage_members_add_success(self, mock_service):
         result = await manage_space_members("abc", "add", ["test@example.com"])
 
         assert result["operation"] == "add"
         assert "test@example.com" in result["successful"]
         assert len(result["failed"]) == 0
 
-    @patch("src.providers.google_chat.api.spaces.build")
-    @patch("src.providers.google_chat.api.spaces.get_credentials")
-    async def test_manage_members_remove_success(self, mock_get_creds, mock_build):
-        mock_service = MagicMock()
-        mock_get_creds.return_value = MagicMock()
-        mock_build.return_value = mock_service
-
+    async def test_manage_members_remove_success(self, mock_service):
         result = await manage_space_members("abc", "remove", ["test@example.com"])
 
         assert result["operation"] == "remove"
@@ -58,12 +51,8 @@ class TestChatSpaces:
         with pytest.raises(Exception, match="No valid credentials found"):
             await manage_space_members("abc", "add", ["test@example.com"])
 
-    @patch("src.providers.google_chat.api.spaces.build")
     @patch("src.providers.google_chat.api.spaces.get_credentials")
-    async def test_manage_members_invalid_operation(self, mock_get_creds, mock_build):
-        mock_get_creds.return_value = MagicMock()  # ✅ valid mock Credentials
-        mock_build.return_value = MagicMock()
-
+    async def test_manage_members_invalid_operation(self, mock_get_creds):
         with pytest.raises(ValueError, match="Operation must be either 'add' or 'remove'"):
             await manage_space_members("abc", "update", ["test@example.com"])
-
+        mock_get_creds.assert_not_called()
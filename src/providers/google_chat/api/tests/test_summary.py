@@ -1,20 +1,46 @@
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock
 
+from src.providers.google_chat.api import summary
 from src.providers.google_chat.api.summary import (
     get_my_mentions,
     get_conversation_participants,
     summarize_conversation
 )
 
+@pytest.fixture
+def space_get(patch_api):
+    """Point summary at a fresh Chat service mock and return its spaces().get().execute mock."""
+    service = MagicMock()
+    patch_api(summary, chat=service)
+    return service.spaces.return_value.get.return_value.execute
+
+
+@pytest.fixture
+def mock_list_msgs(monkeypatch):
+    mock = AsyncMock(spec=summary.list_space_messages)
+    monkeypatch.setattr(summary, "list_space_messages", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_list_spaces(monkeypatch):
+    mock = AsyncMock(spec=summary.list_chat_spaces)
+    monkeypatch.setattr(summary, "list_chat_spaces", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_user_info(monkeypatch):
+    mock = AsyncMock(spec=summary.get_current_user_info)
+    monkeypatch.setattr(summary, "get_current_user_info", mock)
+    return mock
+
+
 @pytest.mark.asyncio
 class TestSummaryUtils:
 
-    @patch("src.providers.google_chat.api.summary.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.summary.get_current_user_info", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.summary.list_space_messages", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.summary.build")
-    async def test_get_my_mentions_single_space(self, mock_build, mock_list_msgs, mock_user_info, mock_creds):
+    async def test_get_my_mentions_single_space(self, space_get, mock_list_msgs, mock_user_info):
         mock_user_info.return_value = {"display_name": "Alice"}
         mock_list_msgs.return_value = {
             "messages": [
@@ -22,7 +48,7 @@ class TestSummaryUtils:
                 {"text": "No mention here"}
             ]
         }
-        mock_build.return_value.spaces().get().execute.return_value = {
+        space_get.return_value = {
             "displayName": "Test Space"
         }
 
@@ -30,19 +56,14 @@ class TestSummaryUtils:
         assert len(result["messages"]) == 1
         assert result["messages"][0]["space_info"]["displayName"] == "Test Space"
 
-    @patch("src.providers.google_chat.api.summary.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.summary.get_current_user_info", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.summary.list_chat_spaces", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.summary.list_space_messages", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.summary.build")
-    async def test_get_my_mentions_all_spaces(self, mock_build, mock_list_msgs, mock_list_spaces, mock_user_info, mock_creds):
+    async def test_get_my_mentions_all_spaces(self, space_get, mock_list_msgs, mock_list_spaces, mock_user_info):
         mock_user_info.return_value = {"display_name": "Bob"}
         mock_list_spaces.return_value = [{"name": "spaces/one"}, {"name": "spaces/two"}]
         mock_list_msgs.side_effect = [
             {"messages": [{"text": "hello @bob"}]},
             {"messages": [{"text": "no mention"}]}
         ]
-        mock_build.return_value.spaces().get().execute.return_value = {
+        space_get.return_value = {
             "displayName": "Space"
         }
 
@@ -50,7 +71,6 @@ class TestSummaryUtils:
         assert len(result["messages"]) == 1
         assert "@bob" in result["messages"][0]["text"].lower()
 
-    @patch("src.providers.google_chat.api.summary.list_space_messages", new_callable=AsyncMock)
     async def test_get_conversation_participants(self, mock_list_msgs):
         mock_list_msgs.return_value = {
             "messages": [
@@ -64,11 +84,8 @@ class TestSummaryUtils:
         assert len(participants) == 2
         assert any(p["id"] == "u1" for p in participants)
 
-    @patch("src.providers.google_chat.api.summary.get_credentials", return_value=MagicMock())
-    @patch("src.providers.google_chat.api.summary.list_space_messages", new_callable=AsyncMock)
-    @patch("src.providers.google_chat.api.summary.build")
-    async def test_summarize_conversation(self, mock_build, mock_list_msgs, mock_get_creds):
-        mock_build.return_value.spaces().get().execute.return_value = {
+    async def test_summarize_conversation(self, space_get, mock_list_msgs):
+        space_get.return_value = {
             "name": "spaces/abc",
             "displayName": "Chat Space",
             "type": "ROOM"
@@ -3,11 +3,6 @@ Test fixtures for Google Chat MCP tests.
 """
 
 import pytest
-import os
-import sys
-
-# Add the project root to the path so we can import the src modules
-sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 
 # Import authentication test instead
 from src.providers.google_chat.tools.tests.test_auth_tools import test_authentication
@@ -26,8 +21,8 @@ async def authenticated():
 
 
 @pytest.fixture(scope="session")
-async def test_space():
-    """Fixture to provide a test space."""
+def test_space():
+    """Fixture to provide a test space; it awaits nothing, so it needs no event loop."""
     return TEST_SPACE
 
 
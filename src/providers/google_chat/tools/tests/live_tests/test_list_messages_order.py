@@ -4,8 +4,9 @@ import os
 import sys
 from datetime import datetime
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../..")))
+if __name__ == "__main__":
+    # Run directly, outside pytest's pythonpath: put the project root on sys.path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../..")))
 
 from src.providers.google_chat.tools.message_tools import get_space_messages_tool
 
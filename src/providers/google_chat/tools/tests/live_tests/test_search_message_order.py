@@ -5,8 +5,9 @@ import sys
 from datetime import datetime
 from unittest.mock import patch
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../..")))
+if __name__ == "__main__":
+    # Run directly, outside pytest's pythonpath: put the project root on sys.path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../..")))
 
 from src.providers.google_chat.tools.search_tools import search_messages_tool
 
@@ -5,7 +5,6 @@
 # """
 
 import pytest
-from datetime import datetime
 
 from src.providers.google_chat.tools.message_tools import (
     send_message_tool,
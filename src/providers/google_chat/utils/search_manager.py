@@ -1,12 +1,16 @@
 """
 Search Manager - Centralized system for advanced message searching
 """
+import bisect
+import copy
+import functools
+import json
 import logging
 import os
 import re
 import unicodedata
 from collections import defaultdict
-from typing import Optional
+from typing import Optional, TextIO, Union
 
 import yaml
 
@@ -34,22 +38,110 @@ except ImportError:
     HAS_NUMPY = False
     logger.warning("NumPy is not available - semantic search will be limited")
 
+# Regex scores stop growing after this many matches, so counting stops there too
+_MAX_SCORED_MATCHES = 5
+
+# Messages are joined with this separator so one finditer pass covers a whole batch
+_JOIN_SEPARATOR = "\x00"
+# Anchors and lookarounds behave differently next to a separator than at a string edge
+_JOIN_UNSAFE_TOKENS = ("^", "$", "\\A", "\\Z", "(?=", "(?!", "(?<")
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime: float) -> dict:
+    """Parse a YAML, JSON or TOML config file, cached by (path, mtime) so edits to the file are picked up."""
+    extension = os.path.splitext(config_path)[1].lower()
+    if extension == '.toml':
+        if tomllib is None:
+            raise ImportError("TOML search configs require Python 3.11+ (tomllib)")
+        with open(config_path, 'rb') as f:
+            return tomllib.load(f)
+    with open(config_path, 'r') as f:
+        if extension == '.json':
+            return json.load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    """Compile a regex pattern, cached by (pattern, flags) across SearchManager instances."""
+    return re.compile(pattern, flags)
+
+def _count_matches(pattern: re.Pattern, text: str) -> tuple[int, int]:
+    """Return (match count capped at _MAX_SCORED_MATCHES, start of the first match) for one text."""
+    match_count = 0
+    first_start = 0
+    for match in pattern.finditer(text):
+        if match_count == 0:
+            first_start = match.start()
+        match_count += 1
+        if match_count >= _MAX_SCORED_MATCHES:
+            break
+    return match_count, first_start
+
+def _count_matches_joined(pattern: re.Pattern, texts: list[str]) -> Optional[list[tuple[int, int]]]:
+    """
+    Count matches for every text with a single finditer pass over the separator-joined batch.
+
+    Returns None when the batch can't be scanned that way - an anchored or lookaround pattern,
+    a separator inside a text, or a match running across two texts - so the caller can fall
+    back to _count_matches per text.
+    """
+    if any(token in pattern.pattern for token in _JOIN_UNSAFE_TOKENS):
+        return None
+    if any(_JOIN_SEPARATOR in text for text in texts):
+        return None
+
+    # Start offset of each text in the joined string
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+
+    hits = [(0, 0)] * len(texts)
+    for match in pattern.finditer(_JOIN_SEPARATOR.join(texts)):
+        idx = bisect.bisect_right(starts, match.start()) - 1
+        if match.end() - starts[idx] > len(texts[idx]):
+            return None
+        match_count, first_start = hits[idx]
+        if match_count == 0:
+            first_start = match.start() - starts[idx]
+        if match_count < _MAX_SCORED_MATCHES:
+            hits[idx] = (match_count + 1, first_start)
+    return hits
+
+
 class SearchManager:
     """Manages search operations across different search modes based on configuration."""
 
-    def __init__(self, config_path: str = ("%s" % SEARCH_CONFIG_YAML_PATH)):
-        """Initialize the search manager with the provided configuration file."""
-        logger.info(f"Initializing SearchManager with config: {config_path}")
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = ("%s" % SEARCH_CONFIG_YAML_PATH), config: Optional[dict] = None,
+                 config_stream: Optional[TextIO] = None):
+        """Initialize the search manager from a configuration file, a YAML stream or an already-loaded config dict."""
+        if config is not None:
+            logger.info("Initializing SearchManager with provided config")
+        elif config_stream is not None:
+            logger.info("Initializing SearchManager with config stream")
+            config = self._parse_config(config_stream)
+        else:
+            logger.info(f"Initializing SearchManager with config: {config_path}")
+            config = self._load_config(config_path)
+        self.config = config
         self.search_modes = {}
         self._initialize_search_modes()
 
-        # Initialize semantic search provider if enabled
+        # Initialize semantic search provider; the model is only loaded if semantic mode is enabled
         semantic_config = self.search_modes.get("semantic", {}).get("options", {})
         model_name = semantic_config.get("model", "all-MiniLM-L6-v2")
         cache_size = semantic_config.get("cache_max_size", 10000)
         logger.info(f"Setting up semantic provider with model: {model_name}")
-        self.semantic_provider = SemanticSearchProvider(model_name, cache_size)
+        self.semantic_provider = SemanticSearchProvider(model_name, cache_size, enabled="semantic" in self.search_modes)
 
     def _load_config(self, config_path: str) -> dict:
         """Load search configuration from a YAML file."""
@@ -57,8 +149,14 @@ class SearchManager:
             logger.error(f"Search configuration file not found: {config_path}")
             raise FileNotFoundError(f"Search configuration file not found: {config_path}")
 
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Hand out a copy so callers can't mutate the cached config
+        config = copy.deepcopy(_load_config_cached(os.path.abspath(config_path), os.path.getmtime(config_path)))
+        logger.info(f"Loaded configuration with {len(config.get('search_modes', []))} search modes")
+        return config
+
+    def _parse_config(self, stream: TextIO) -> dict:
+        """Parse search configuration from a YAML stream."""
+        config = yaml.load(stream, Loader=_YAML_LOADER)
         logger.info(f"Loaded configuration with {len(config.get('search_modes', []))} search modes")
         return config
 
@@ -75,21 +173,30 @@ class SearchManager:
         logger.info(f"Using default search mode: {default}")
         return default
 
-    def search(self, query: str, messages: list[dict], mode: Optional[str] = None) -> list[tuple[float, dict]]:
+    def search(self, query: Union[str, re.Pattern], messages: list[dict], mode: Optional[str] = None) -> list[tuple[float, dict]]:
         """
         Search messages using the specified mode.
 
         Args:
-            query: The search query
+            query: The search query, or a precompiled re.Pattern (mode must be None or 'regex')
             messages: list of message objects to search through
             mode: Search mode (exact, regex, semantic, hybrid)
                   If None, uses the default mode from config
 
         Returns:
             list of tuples (score, message) sorted by relevance score (descending)
+
+        Raises:
+            ValueError: If a precompiled pattern is given with a mode other than regex
         """
         logger.info(f"Starting search with query: '{query}', mode: {mode or 'default'}, message count: {len(messages)}")
 
+        if isinstance(query, re.Pattern):
+            if mode not in (None, "regex"):
+                raise ValueError(f"A precompiled pattern can only be searched in regex mode, not '{mode}'")
+            logger.info("Using regex search mode for precompiled pattern")
+            return self._regex_search(query, messages)
+
         if mode is None:
             mode = self.get_default_mode()
             logger.info(f"Using default mode: {mode}")
@@ -203,12 +310,15 @@ class SearchManager:
         results.sort(key=lambda x: x[0], reverse=True)
         return results
 
-    def _regex_search(self, query: str, messages: list[dict]) -> list[tuple[float, dict]]:
-        """Perform regular expression matching."""
-        results = []
+    def _regex_search(self, query: Union[str, re.Pattern], messages: list[dict]) -> list[tuple[float, dict]]:
+        """Perform regular expression matching; a precompiled re.Pattern is used as-is."""
         weight = self.search_modes.get("regex", {}).get("weight", 1.0)
         regex_options = self.search_modes.get("regex", {}).get("options", {})
 
+        if isinstance(query, re.Pattern):
+            logger.info(f"Regex search with precompiled pattern: '{query.pattern}'")
+            return self._score_regex_matches(query, messages, weight)
+
         # Normalize the query to handle Unicode characters like smart quotes
         normalized_query = unicodedata.normalize('NFKD', query)
         # Explicitly replace smart apostrophes with standard ASCII apostrophes
@@ -274,29 +384,36 @@ class SearchManager:
                 flexible_query = flexible_query[:max_length]
 
             # First try with the flexible pattern
-            pattern = re.compile(flexible_query, flags)
-
-            for msg in messages:
-                # Normalize the text to handle Unicode characters
-                original_text = msg.get("text", "")
-                normalized_text = unicodedata.normalize('NFKD', original_text)
-                # Explicitly replace smart apostrophes with standard ASCII apostrophes
-                normalized_text = normalized_text.replace('\u2019', "'").replace('\u2018', "'")
-
-                if normalized_text:
-                    matches = list(pattern.finditer(normalized_text))
-                    if matches:
-                        # Score based on number of matches and position of first match
-                        match_count = len(matches)
-                        first_pos = matches[0].start() / len(normalized_text) if matches else 1.0
-                        position_factor = 1.0 - first_pos
-                        score = weight * (0.6 + 0.2 * min(match_count, 5) + 0.2 * position_factor)
-                        results.append((score, msg))
+            pattern = _compile_regex(flexible_query, flags)
         except re.error as e:
             # Log the error and fallback to exact search
             logger.warning(f"Invalid regex pattern '{flexible_query}': {str(e)}. Falling back to exact search.")
             return self._exact_search(query, messages)
 
+        return self._score_regex_matches(pattern, messages, weight)
+
+    def _score_regex_matches(self, pattern: re.Pattern, messages: list[dict], weight: float) -> list[tuple[float, dict]]:
+        """Score messages matched by a compiled regex pattern."""
+        texts = []
+        for msg in messages:
+            # Normalize the text to handle Unicode characters
+            original_text = msg.get("text", "")
+            normalized_text = unicodedata.normalize('NFKD', original_text)
+            # Explicitly replace smart apostrophes with standard ASCII apostrophes
+            texts.append(normalized_text.replace('\u2019', "'").replace('\u2018', "'"))
+
+        hits = _count_matches_joined(pattern, texts)
+        if hits is None:
+            hits = [_count_matches(pattern, text) if text else (0, 0) for text in texts]
+
+        results = []
+        for msg, normalized_text, (match_count, first_start) in zip(messages, texts, hits):
+            if normalized_text and match_count:
+                # Score based on number of matches and position of first match
+                position_factor = 1.0 - first_start / len(normalized_text)
+                score = weight * (0.6 + 0.2 * match_count + 0.2 * position_factor)
+                results.append((score, msg))
+
         # Sort by score (descending) using only the score value for comparison
         results.sort(key=lambda x: x[0], reverse=True)
         return results
@@ -503,12 +620,16 @@ class SearchManager:
 class SemanticSearchProvider:
     """Provider for semantic search using free, lightweight models."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_size: int = 10000):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_size: int = 10000, enabled: bool = True):
         self.model_name = model_name
         self.cache_size = cache_size
         self.model = None
         self.cache = {}  # Simple cache for embeddings
         self.available = False  # Initialize to False by default
+        if not enabled:
+            # Skip importing sentence-transformers and loading the model entirely
+            logger.info("Semantic search disabled in configuration - not loading a model")
+            return
         logger.info(f"Initializing SemanticSearchProvider with model: {model_name}")
         self._initialize()
 
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the Google Chat utility tests.
+"""
+
+import os
+
+import pytest
+
+from src.mcp_core.engine.provider_loader import get_provider_config_value, initialize_provider_config
+
+
+@pytest.fixture(scope="session")
+def search_config_path():
+    """Absolute path of the provider's search config, resolved once per session."""
+    initialize_provider_config("google_chat")
+    path = get_provider_config_value("google_chat", "search_config_path")
+    if not os.path.isabs(path):
+        # Relative paths are resolved against the project root (parent of src)
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../'))
+        path = os.path.join(project_root, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def search_config(search_config_path):
+    """Load search configuration from YAML file; tests only read it."""
+    import yaml
+
+    with open(search_config_path, "r") as f:
+        return yaml.safe_load(f)
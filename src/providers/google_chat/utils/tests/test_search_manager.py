@@ -1,30 +1,28 @@
+import io
 import os
+import re
 import pytest
 import numpy as np
-import yaml
 from unittest.mock import MagicMock, patch
-from src.providers.google_chat.utils.search_manager import SearchManager
-from src.mcp_core.engine.provider_loader import get_provider_config_value, initialize_provider_config
+from src.providers.google_chat.utils.search_manager import (
+    SearchManager, _compile_regex, _count_matches, _count_matches_joined, _load_config_cached, tomllib
+)
 
-# Initialize the provider configuration
-initialize_provider_config("google_chat")
-
-# Get search config path from provider config
-SEARCH_CONFIG_YAML_PATH = get_provider_config_value("google_chat", "search_config_path")
-
-# Convert to absolute path if it's a relative path
-if not os.path.isabs(SEARCH_CONFIG_YAML_PATH):
-    # Get the project root directory (parent of src)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../'))
-    SEARCH_CONFIG_YAML_PATH = os.path.join(project_root, SEARCH_CONFIG_YAML_PATH)
+# Keep the module on one xdist worker so each class-scoped manager is built once;
+# the filesystem tests override this with their own group
+pytestmark = pytest.mark.xdist_group(name="search_manager")
 
 # ------------------------------------------------------------------------------
 # Fixtures
 # ------------------------------------------------------------------------------
 
-@pytest.fixture
-def regex_manager():
-    manager = SearchManager()
+@pytest.fixture(scope="class")
+def manager(search_config):
+    """One manager per test class; tests that change it go through monkeypatch."""
+    return SearchManager(config=search_config)
+
+@pytest.fixture(scope="class")
+def regex_manager(manager):
     manager.search_modes["regex"] = {
         "enabled": True,
         "weight": 1.0,
@@ -37,9 +35,8 @@ def regex_manager():
     }
     return manager
 
-@pytest.fixture
-def real_manager():
-    manager = SearchManager()
+@pytest.fixture(scope="class")
+def real_manager(manager):
     if not manager.semantic_provider.available:
         pytest.skip("Semantic search provider not available.")
     return manager
@@ -60,11 +57,6 @@ def mock_semantic_provider():
     provider.compute_similarity.side_effect = lambda a, b, _: similarities.get((a, b), 0.3)
     return provider
 
-@pytest.fixture(scope="module")
-def search_config():
-    with open(SEARCH_CONFIG_YAML_PATH, "r") as f:
-        return yaml.safe_load(f)
-
 @pytest.fixture(scope="module")
 def similarity_threshold(search_config):
     semantic = next((m for m in search_config.get("search_modes", []) if m.get("name") == "semantic"), {})
@@ -89,6 +81,15 @@ MESSAGES = [
     {"name": "m16", "text": "[WARN] Memory usage high"},
 ]
 
+CICD_PATTERN = re.compile(r"ci[ /\-_]?cd|cicd", re.IGNORECASE)
+
+CICD_MESSAGES = (
+    {"name": "c1", "text": "We need to update the CICD pipeline"},
+    {"name": "c2", "text": "The CI/CD job failed overnight"},
+    {"name": "c3", "text": "ci-cd docs are out of date"},
+    {"name": "c4", "text": "Lunch is at noon"},
+)
+
 # ------------------------------------------------------------------------------
 # Test Suites
 # ------------------------------------------------------------------------------
@@ -117,6 +118,44 @@ class TestRegexSearchSuite:
         results = regex_manager._regex_search(pattern, MESSAGES)
         assert any(text in msg["text"] for _, msg in results)
 
+    def test_compiled_pattern_is_cached(self, regex_manager):
+        _compile_regex.cache_clear()
+        regex_manager._regex_search(r"\[ERROR\]", MESSAGES)
+        regex_manager._regex_search(r"\[ERROR\]", MESSAGES)
+        info = _compile_regex.cache_info()
+        assert info.misses == 1 and info.hits == 1
+
+    def test_precompiled_pattern_skips_compile(self, regex_manager):
+        _compile_regex.cache_clear()
+        results = regex_manager.search(CICD_PATTERN, list(CICD_MESSAGES), mode="regex")
+        assert {msg["name"] for _, msg in results} == {"c1", "c2", "c3"}
+        assert _compile_regex.cache_info().currsize == 0
+
+    @pytest.mark.parametrize("mode", ["exact", "semantic", "hybrid"])
+    def test_precompiled_pattern_rejects_other_modes(self, regex_manager, mode):
+        with pytest.raises(ValueError, match="regex mode"):
+            regex_manager.search(CICD_PATTERN, list(CICD_MESSAGES), mode=mode)
+
+    def test_match_count_is_capped(self, regex_manager):
+        capped, longer = regex_manager._regex_search(r"x", [
+            {"name": "five", "text": "x " * 5},
+            {"name": "fifty", "text": "x " * 50},
+        ])
+        assert capped[0] == pytest.approx(longer[0])
+
+    @pytest.mark.parametrize("pattern", [
+        r"\b[A-Z]{2,}-\d+\b", r"[a-z]", r"x*", r"\d+", CICD_PATTERN.pattern,
+    ])
+    def test_joined_scan_matches_per_message_scan(self, pattern):
+        compiled = re.compile(pattern, re.IGNORECASE)
+        texts = [msg["text"] for msg in MESSAGES + list(CICD_MESSAGES)] + [""]
+        assert _count_matches_joined(compiled, texts) == [_count_matches(compiled, text) for text in texts]
+
+    @pytest.mark.parametrize("pattern", [r"deploy.*fail", r"^Release", r"db(?!\w)"])
+    def test_joined_scan_defers_when_unsafe(self, pattern):
+        compiled = re.compile(pattern, re.IGNORECASE | re.DOTALL)
+        assert _count_matches_joined(compiled, ["deploy started", "it did fail", "Release db"]) is None
+
     def test_invalid_regex_fails_gracefully(self, regex_manager):
         results = regex_manager._regex_search(r"bad(pattern", MESSAGES)
         assert isinstance(results, list) and len(results) == 0
@@ -124,19 +163,18 @@ class TestRegexSearchSuite:
 
 class TestSemanticSearchMocked:
 
-    def test_semantic_search_with_mock_provider(self, mock_semantic_provider):
+    def test_semantic_search_with_mock_provider(self, mock_semantic_provider, manager, monkeypatch):
         messages = [
             {"name": "msg1", "text": "I'm feeling sick today"},
             {"name": "msg5", "text": "I'm out sick with the flu"},
             {"name": "msg7", "text": "Meeting notes from yesterday"},
         ]
-        manager = SearchManager()
-        manager.semantic_provider = mock_semantic_provider
-        manager.search_modes["semantic"] = {
+        monkeypatch.setattr(manager, "semantic_provider", mock_semantic_provider)
+        monkeypatch.setitem(manager.search_modes, "semantic", {
             "enabled": True,
             "weight": 1.5,
             "options": {"similarity_threshold": 0.6, "similarity_metric": "cosine"}
-        }
+        })
         results = manager._semantic_search("unhealthy", messages)
         texts = [msg["text"] for _, msg in results]
         assert "I'm feeling sick today" in texts
@@ -148,29 +186,27 @@ class TestSemanticSearchMocked:
         (0.8, 1),
         (0.85, 1),
     ])
-    def test_semantic_threshold_effect(self, mock_semantic_provider, threshold, expected_min):
+    def test_semantic_threshold_effect(self, mock_semantic_provider, threshold, expected_min, manager, monkeypatch):
         messages = [
             {"name": "msg1", "text": "I'm feeling sick today"},
             {"name": "msg5", "text": "I'm out sick with the flu"},
         ]
-        manager = SearchManager()
-        manager.semantic_provider = mock_semantic_provider
-        manager.search_modes["semantic"] = {
+        monkeypatch.setattr(manager, "semantic_provider", mock_semantic_provider)
+        monkeypatch.setitem(manager.search_modes, "semantic", {
             "enabled": True,
             "weight": 1.0,
             "options": {
                 "similarity_threshold": threshold,
                 "similarity_metric": "cosine"
             }
-        }
+        })
         results = manager._semantic_search("unhealthy", messages)
         assert len(results) >= expected_min
 
 
 class TestSearchSortingLogic:
 
-    def test_exact_search_sorting(self):
-        manager = SearchManager()
+    def test_exact_search_sorting(self, manager):
         messages = [
             {"name": "msg1", "text": "first"},
             {"name": "msg2", "text": "second"},
@@ -179,9 +215,9 @@ class TestSearchSortingLogic:
         scores = [score for score, _ in manager._exact_search("message", messages)]
         assert all(scores[i] >= scores[i+1] for i in range(len(scores)-1))
 
-    def test_semantic_sorting_logic(self):
-        manager = SearchManager()
-        manager.semantic_provider = MagicMock()
+    def test_semantic_sorting_logic(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, "semantic_provider", MagicMock())
+        monkeypatch.setattr(manager, "_current_msg_name", None, raising=False)
         manager.semantic_provider.available = True
         manager.semantic_provider.get_embedding.return_value = np.array([1, 0, 0])
         values = {"msg1": 0.9, "msg2": 0.7, "msg3": 0.8}
@@ -201,18 +237,16 @@ class TestSearchSortingLogic:
         results.sort(key=lambda x: x[0], reverse=True)
         assert [r[1]["name"] for r in results] == ["msg1", "msg3", "msg2"]
 
-    def test_hybrid_search(self):
+    def test_hybrid_search(self, manager, monkeypatch):
         with patch('src.providers.google_chat.utils.search_manager.SearchManager._exact_search') as exact, \
              patch('src.providers.google_chat.utils.search_manager.SearchManager._regex_search') as regex, \
              patch('src.providers.google_chat.utils.search_manager.SearchManager._semantic_search') as semantic:
-
-            manager = SearchManager()
-            manager.search_modes = {
+            monkeypatch.setattr(manager, "search_modes", {
                 "exact": {"enabled": True},
                 "regex": {"enabled": True},
                 "semantic": {"enabled": True}
-            }
-            manager.config = {
+            })
+            monkeypatch.setattr(manager, "config", {
                 "search": {
                     "hybrid_weights": {
                         "exact": 1.0,
@@ -220,9 +254,8 @@ class TestSearchSortingLogic:
                         "semantic": 1.5
                     }
                 }
-            }
-            manager.semantic_provider = MagicMock()
-            manager.semantic_provider.available = True
+            })
+            monkeypatch.setattr(manager, "semantic_provider", MagicMock(available=True))
 
             exact.return_value = [(0.8, {"name": "msg1"}), (0.6, {"name": "msg2"})]
             regex.return_value = [(0.9, {"name": "msg2"}), (0.7, {"name": "msg3"})]
@@ -234,32 +267,111 @@ class TestSearchSortingLogic:
 
 class TestFallbackAndErrorHandling:
 
-    def test_fallback_to_default_mode(self):
-        manager = SearchManager()
-        manager._exact_search = MagicMock(return_value=[(1.0, {"name": "msg"})])
-        manager.get_default_mode = MagicMock(return_value="exact")
+    def test_fallback_to_default_mode(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, "_exact_search", MagicMock(return_value=[(1.0, {"name": "msg"})]))
+        monkeypatch.setattr(manager, "get_default_mode", MagicMock(return_value="exact"))
         result = manager.search("query", [{"name": "msg", "text": "hi"}], mode=None)
         assert result[0][1]["name"] == "msg"
 
-    def test_invalid_mode_falls_back_to_exact(self):
-        manager = SearchManager()
-        manager._exact_search = MagicMock(return_value=[(1.0, {"name": "msg"})])
+    def test_invalid_mode_falls_back_to_exact(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, "_exact_search", MagicMock(return_value=[(1.0, {"name": "msg"})]))
         result = manager.search("query", [{"name": "msg", "text": "hi"}], mode="unsupported")
         assert result[0][1]["name"] == "msg"
 
-    def test_semantic_disabled_falls_back(self):
-        manager = SearchManager()
-        manager.semantic_provider = MagicMock()
-        manager.semantic_provider.available = False
-        manager._exact_search = MagicMock(return_value=[(1.0, {"name": "fallback"})])
+    def test_semantic_disabled_falls_back(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, "semantic_provider", MagicMock(available=False))
+        monkeypatch.setattr(manager, "_exact_search", MagicMock(return_value=[(1.0, {"name": "fallback"})]))
         result = manager.search("query", [{"name": "fallback", "text": "text"}], mode="semantic")
         assert result[0][1]["name"] == "fallback"
 
+    @pytest.mark.serial
+    @pytest.mark.xdist_group(name="filesystem")
     def test_missing_config_file_raises(self):
         with pytest.raises(FileNotFoundError):
             SearchManager(config_path="does_not_exist.yaml")
 
 
+class TestSearchManagerConfig:
+
+    @pytest.mark.parametrize("config,expected_modes,expected_default", [
+        ({"search_modes": [{"name": "regex", "enabled": True}], "search": {"default_mode": "regex"}},
+         {"regex"}, "regex"),
+        ({"search_modes": [{"name": "regex", "enabled": True}, {"name": "exact", "enabled": False}]},
+         {"regex"}, "exact"),
+        ({"search_modes": [{"name": "exact", "enabled": True}, {"name": "semantic", "enabled": True}],
+          "search": {"default_mode": "semantic"}},
+         {"exact", "semantic"}, "semantic"),
+    ])
+    @patch("src.providers.google_chat.utils.search_manager.SemanticSearchProvider._initialize")
+    def test_search_mode_options(self, mock_initialize, config, expected_modes, expected_default):
+        manager = SearchManager(config=config)
+        assert set(manager.search_modes) == expected_modes
+        assert manager.get_default_mode() == expected_default
+
+    @patch("src.providers.google_chat.utils.search_manager.SemanticSearchProvider._initialize")
+    def test_semantic_model_not_loaded_when_disabled(self, mock_initialize):
+        manager = SearchManager(config={"search_modes": [
+            {"name": "regex", "enabled": True},
+            {"name": "semantic", "enabled": False},
+        ]})
+        mock_initialize.assert_not_called()
+        assert manager.semantic_provider.available is False
+
+    def test_search_manager_initialization_from_stream(self):
+        yaml_text = (
+            "search:\n"
+            "  default_mode: regex\n"
+            "search_modes:\n"
+            "  - name: regex\n"
+            "    enabled: true\n"
+            "  - name: semantic\n"
+            "    enabled: false\n"
+        )
+        manager = SearchManager(config_stream=io.StringIO(yaml_text))
+        assert set(manager.search_modes) == {"regex"}
+        assert manager.get_default_mode() == "regex"
+
+    @pytest.mark.slow
+    @pytest.mark.serial
+    @pytest.mark.xdist_group(name="filesystem")
+    def test_search_manager_initialization_from_yaml(self, search_config_path, search_config):
+        manager = SearchManager(config_path=search_config_path)
+        assert manager.config == search_config
+        assert "regex" in manager.search_modes
+
+    @pytest.mark.serial
+    @pytest.mark.xdist_group(name="filesystem")
+    @pytest.mark.parametrize("filename,text", [
+        ("search_config.json",
+         '{"search": {"default_mode": "regex"}, "search_modes": [{"name": "regex", "enabled": true}]}'),
+        pytest.param("search_config.toml",
+                     '[search]\ndefault_mode = "regex"\n\n[[search_modes]]\nname = "regex"\nenabled = true\n',
+                     marks=pytest.mark.skipif(tomllib is None, reason="tomllib requires Python 3.11+")),
+    ])
+    def test_search_manager_initialization_from_other_formats(self, tmp_path, filename, text):
+        config_file = tmp_path / filename
+        config_file.write_text(text)
+        manager = SearchManager(config_path=str(config_file))
+        assert set(manager.search_modes) == {"regex"}
+        assert manager.get_default_mode() == "regex"
+
+    @pytest.mark.serial
+    @pytest.mark.xdist_group(name="filesystem")
+    def test_config_file_cache_tracks_mtime(self, tmp_path):
+        config_file = tmp_path / "search_config.yaml"
+        config_file.write_text("search_modes:\n  - name: regex\n    enabled: true\n")
+        _load_config_cached.cache_clear()
+
+        first = SearchManager(config_path=str(config_file))
+        second = SearchManager(config_path=str(config_file))
+        assert _load_config_cached.cache_info().hits == 1
+        assert first.config == second.config and first.config is not second.config
+
+        config_file.write_text("search_modes:\n  - name: exact\n    enabled: true\n")
+        os.utime(config_file, (0, os.path.getmtime(config_file) + 1))
+        assert set(SearchManager(config_path=str(config_file)).search_modes) == {"exact"}
+
+
 @pytest.mark.usefixtures("real_manager", "similarity_threshold")
 class TestSemanticSimilarityScores:
 
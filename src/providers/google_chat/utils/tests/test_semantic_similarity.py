@@ -1,28 +1,9 @@
-import os
 import pytest
-import yaml
 
-from src.mcp_core.engine.provider_loader import get_provider_config_value, initialize_provider_config
 from src.providers.google_chat.utils.search_manager import SearchManager
 
-# Initialize the provider configuration
-initialize_provider_config("google_chat")
-
-# Get search config path from provider config
-SEARCH_CONFIG_YAML_PATH = get_provider_config_value("google_chat", "search_config_path")
-
-# Convert to absolute path if it's a relative path
-if not os.path.isabs(SEARCH_CONFIG_YAML_PATH):
-    # Get the project root directory (parent of src)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../'))
-    SEARCH_CONFIG_YAML_PATH = os.path.join(project_root, SEARCH_CONFIG_YAML_PATH)
-
-
-@pytest.fixture(scope="module")
-def search_config():
-    """Load search configuration from YAML file."""
-    with open(SEARCH_CONFIG_YAML_PATH, "r") as f:
-        return yaml.safe_load(f)
+# Keep the module on one xdist worker so the embedding model is loaded once
+pytestmark = pytest.mark.xdist_group(name="semantic_similarity")
 
 
 @pytest.fixture(scope="module")
@@ -34,9 +15,9 @@ def similarity_threshold(search_config):
 
 
 @pytest.fixture(scope="module")
-def manager():
+def manager(search_config):
     """Initialize and return the SearchManager."""
-    manager = SearchManager()
+    manager = SearchManager(config=search_config)
     if not manager.semantic_provider.available:
         pytest.skip("Semantic search provider not available.")
     return manager